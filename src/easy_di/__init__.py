@@ -9,8 +9,16 @@ See the README file for information on usage and redistribution.
 """
 from .base_injector import BaseInjector
 from .group_injector import GroupInjector
+from .manifest import Manifest
+from .providers import ScopedProvider, TaskLocalProvider, ThreadLocalProvider
+from .snapshot import RegistrySnapshot
+from .tracing import (InMemorySpanExporter, OpenTelemetrySpanExporter, Span,
+                      SpanExporter, SpanExportResult, Tracer)
 
-__all__ = ["BaseInjector", "GroupInjector"]
+__all__ = ["BaseInjector", "GroupInjector", "InMemorySpanExporter",
+           "Manifest", "OpenTelemetrySpanExporter", "RegistrySnapshot",
+           "ScopedProvider", "Span", "SpanExportResult", "SpanExporter",
+           "TaskLocalProvider", "ThreadLocalProvider", "Tracer"]
 __author__ = "David Lishchyshen"
 __version__ = "1.0.0"
 __email__ = "microdaika1@gmail.com"
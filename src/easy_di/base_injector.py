@@ -6,9 +6,8 @@ See the README file for information on usage and redistribution.
 """
 from __future__ import annotations
 
-import functools
 import sys
-from typing import Any, Callable, ClassVar, Dict, TypeVar
+from typing import Any, Callable, ClassVar, Dict, List, Optional, TypeVar
 from warnings import warn
 
 if sys.version_info >= (3, 10):
@@ -17,7 +16,12 @@ else:
     from typing_extensions import ParamSpec, Concatenate
 
 from .exceptions import (DependencyNotRegisteredError,
-                         DependencyRegisteredError, OverwritingArgumentError)
+                         DependencyRegisteredError)
+from .injection import inject
+from .providers import ManagedDependency, resolve, retire
+from .registry import Registry
+from .snapshot import RegistrySnapshot
+from .tracing import Tracer
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -30,7 +34,8 @@ class BaseInjector:
     dynamically into functions using decorators.
     """
 
-    _registered_dependencies: ClassVar[Dict[str, Any]] = {}
+    _registry: ClassVar[Registry[Dict[str, Any]]] = Registry({})
+    _tracer: ClassVar[Optional[Tracer]] = None
     def __init__(self, *dependencies: str) -> None:
         """Initialize the injector with a list of dependency IDs.
 
@@ -54,27 +59,39 @@ class BaseInjector:
         :param func: The function that requires dependency injection.
         :return: A new function with injected dependencies.
         """
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            if "deps" in kwargs:
-                raise OverwritingArgumentError("deps")
-            try:
-                registered_dependencies = (self
-                                           ._registered_dependencies)
-                deps = {
-                    i: registered_dependencies[i] for i in self._dependencies
-                }
-            except KeyError as e:
-                raise DependencyNotRegisteredError(e.args[0]) from e
-            return func(deps, *args, **kwargs)
-        return wrapper
+        return inject(func,
+                      self._dependencies,
+                      self._resolve_dependencies,
+                      lambda: self._tracer)
+
+    def _resolve_dependencies(
+            self,
+            leases: List[ManagedDependency]) -> Dict[str, Any]:
+        registered_dependencies = self._registry.dependencies
+        try:
+            found = [registered_dependencies[i] for i in self._dependencies]
+        except KeyError as e:
+            raise DependencyNotRegisteredError(e.args[0]) from e
+        return {
+            i: resolve(dependency, leases)
+            for i, dependency in zip(self._dependencies, found)
+        }
 
     @classmethod
-    def register(cls, dependency_id: str, dependency: Any) -> None:
+    def register(
+            cls,
+            dependency_id: str,
+            dependency: Any,
+            *,
+            finalizer: Optional[Callable[[Any], Any]] = None) -> None:
         """Register a dependency with a unique string ID.
 
         :param dependency_id: The unique identifier for the dependency.
         :param dependency: The actual dependency (e.g., object, class, function).
+            A :class:`~easy_di.providers.ScopedProvider` is resolved to its
+            value for the current thread or task on every injection.
+        :param finalizer: Called with the dependency once it is replaced or
+            unregistered and no running call uses it anymore.
         :raises TypeError: If the dependency ID is not a string.
         :raises ValueError: If the dependency ID is '*'.
         :raises DependencyRegisteredError: If the dependency ID is already registered.
@@ -83,10 +100,44 @@ class BaseInjector:
             raise ValueError("Dependency ID cannot be '*'")
         if not isinstance(dependency_id, str):
             raise TypeError("Dependency ID must be a string")
-        if dependency_id in cls._registered_dependencies:
+        registry = cls._registry
+        if dependency_id in registry.dependencies:
             raise DependencyRegisteredError(dependency_id)
-        cls._registered_dependencies[dependency_id] = dependency
+        if finalizer is not None:
+            dependency = ManagedDependency(dependency_id, dependency, finalizer)
+            registry.managed[dependency_id] = dependency
+        registry.writable()[dependency_id] = dependency
 
+    @classmethod
+    def replace(
+            cls,
+            dependency_id: str,
+            dependency: Any,
+            *,
+            finalizer: Optional[Callable[[Any], Any]] = None) -> None:
+        """Atomically replace a registered dependency.
+
+        New calls get the new dependency immediately, while running calls
+        keep the old one. If the old dependency was registered with a
+        finalizer, it is finalized after the last of those calls finishes.
+
+        :param dependency_id: The unique identifier of the dependency.
+        :param dependency: The new dependency.
+        :param finalizer: Called with the new dependency once it is replaced
+            or unregistered and no running call uses it anymore.
+        :raises DependencyNotRegisteredError: If the dependency ID is not registered.
+        """
+        registry = cls._registry
+        if dependency_id not in registry.dependencies:
+            raise DependencyNotRegisteredError(dependency_id)
+        registry.managed.pop(dependency_id, None)
+        if finalizer is not None:
+            dependency = ManagedDependency(dependency_id, dependency, finalizer)
+            registry.managed[dependency_id] = dependency
+        registered_dependencies = registry.writable()
+        old = registered_dependencies[dependency_id]
+        registered_dependencies[dependency_id] = dependency
+        retire(old, dependency)
 
     @classmethod
     def unregister(cls, dependency_id: str) -> None:
@@ -95,10 +146,73 @@ class BaseInjector:
         :param dependency_id: The unique identifier of the dependency to remove.
         :raises DependencyNotRegisteredError: If the dependency ID is not registered.
         """
+        registry = cls._registry
         if dependency_id == "*":
-            cls._registered_dependencies.clear()
+            registered_dependencies = registry.writable()
+            dependencies = list(registered_dependencies.values())
+            registered_dependencies.clear()
+            registry.managed.clear()
+            for dependency in dependencies:
+                retire(dependency)
             warn("Deleted all registered dependencies.")
             return
-        if dependency_id not in cls._registered_dependencies:
+        if dependency_id not in registry.dependencies:
             raise DependencyNotRegisteredError(dependency_id)
-        cls._registered_dependencies.pop(dependency_id)
+        registry.managed.pop(dependency_id, None)
+        retire(registry.writable().pop(dependency_id))
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Tracer]) -> None:
+        """Enable or disable tracing of injected calls.
+
+        :param tracer: The tracer to use, or None to disable tracing.
+        :raises TypeError: If tracer is neither a Tracer nor None.
+        """
+        if tracer is not None and not isinstance(tracer, Tracer):
+            raise TypeError("Tracer must be an instance of Tracer or None")
+        cls._tracer = tracer
+
+    @classmethod
+    def snapshot(cls) -> RegistrySnapshot[Dict[str, Any]]:
+        """Take a snapshot of the registered dependencies.
+
+        The snapshot shares storage with the registry; the registry is copied
+        lazily on its next change, so taking a snapshot is O(1) in the number
+        of dependencies registered without a finalizer. Dependencies with a
+        finalizer are not finalized while the snapshot is alive.
+
+        :return: A snapshot that can be passed to :meth:`restore`.
+        """
+        registry = cls._registry
+        registry.share()
+        return RegistrySnapshot(cls, registry.dependencies, registry.managed)
+
+    @classmethod
+    def restore(cls, snapshot: RegistrySnapshot[Dict[str, Any]]) -> None:
+        """Restore the registered dependencies from a snapshot in O(1).
+
+        Dependencies with a finalizer that are in the snapshot become
+        available again; those registered after it are retired.
+
+        :param snapshot: A snapshot previously taken with :meth:`snapshot`.
+        :raises TypeError: If the snapshot was not taken from an injector
+            sharing this injector's registry.
+        """
+        registry = cls._registry
+        if (not isinstance(snapshot, RegistrySnapshot)
+                or not issubclass(snapshot._owner,  # noqa: SLF001
+                                  BaseInjector)
+                or snapshot._owner._registry is not registry):  # noqa: SLF001
+            raise TypeError("Snapshot was not taken from this injector")
+        dependencies = snapshot._registry  # noqa: SLF001
+        restored: Dict[str, ManagedDependency] = dict(
+            snapshot._managed)  # noqa: SLF001
+        for dependency in restored.values():
+            dependency.revive()
+        retired = registry.managed
+        registry.dependencies = dependencies
+        registry.share()
+        registry.managed = restored
+        for dependency_id, dependency in retired.items():
+            if restored.get(dependency_id) is not dependency:
+                dependency.retire(dependencies.get(dependency_id))
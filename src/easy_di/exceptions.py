@@ -27,6 +27,12 @@ class DependencyRegisteredError(DependencyError):
         return f"Dependency '{self.dependency_id}' is already registered."
 
 
+class DependencyRetiredError(DependencyNotRegisteredError):
+    def __str__(self) -> str:
+        return f"Dependency '{self.dependency_id}' was unregistered while \
+being injected."
+
+
 class DependencyFormatError(DependencyError):
     def __str__(self) -> str:
         return "Dependency must be set with format {group_id}.{dependency}\
@@ -47,3 +53,11 @@ class DependencyGroupRegisteredError(DependencyError):
 
     def __str__(self) -> str:
         return f"Dependency group '{self.group_id}' is already registered."
+
+
+class DependencyScopeError(DependencyError):
+    def __init__(self, scope: str) -> None:
+        self.scope = scope
+
+    def __str__(self) -> str:
+        return f"Dependency requested outside of a '{self.scope}' scope."
@@ -7,9 +7,9 @@ See the README file for information on usage and redistribution.
 
 from __future__ import annotations
 
-import functools
 import sys
-from typing import Any, Callable, ClassVar, Dict, Optional, TypeVar, Literal
+from typing import (Any, Callable, ClassVar, Dict, List, Optional, Tuple,
+                    TypeVar, Literal)
 
 if sys.version_info >= (3, 10):
     from typing import Concatenate, ParamSpec
@@ -22,7 +22,13 @@ from .exceptions import (DependencyFormatError,
                          DependencyGroupNotRegisteredError,
                          DependencyGroupRegisteredError,
                          DependencyNotRegisteredError,
-                         DependencyRegisteredError, OverwritingArgumentError)
+                         DependencyRegisteredError)
+from .injection import inject
+from .manifest import Manifest
+from .providers import ManagedDependency, resolve, retire
+from .registry import Registry
+from .snapshot import RegistrySnapshot
+from .tracing import Tracer
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -34,7 +40,8 @@ FuncForGroupDeps = Callable[
 class GroupInjector:
     """A dependency injector that supports grouping dependencies into named collections."""
 
-    _registered_dependencies: ClassVar[Dict[str, Dict[str, Any]]] = {}
+    _registry: ClassVar[Registry[Dict[str, Dict[str, Any]]]] = Registry({})
+    _tracer: ClassVar[Optional[Tracer]] = None
     def __init__(self, *dependencies: str, group_deps: bool = False) -> None:
         """Initialize the injector as a decorator with a list of required dependencies.
         Dependency IDs must include group names.
@@ -63,35 +70,46 @@ class GroupInjector:
         :param func: The function that requires grouped dependency injection.
         :return: The wrapped function with injected dependencies.
         """
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            if "deps" in kwargs:
-                raise OverwritingArgumentError("deps")
-            try:
-                deps: dict[str, Any]
-                if self._group_deps:
-                    groups = self._split_to_unique_groups(self._dependencies)
-                    deps = {group: {} for group in groups}
-                else:
-                    deps = {}
-                for i in self._dependencies:
-                    dependency, group = self._parse_dependency_and_group(i)
-                    if dependency == "*":
-                        for dependency_id, dependency in (
-                                self._registered_dependencies[group].items()):
-                            if self._group_deps:
-                                deps[group][dependency_id] = dependency
-                            else:
-                                deps[group+"."+dependency_id] = dependency
-                        continue
-                    if self._group_deps:
-                        deps[group][dependency] = self._registered_dependencies[group][dependency]
-                    else:
-                        deps[i] = self._registered_dependencies[group][dependency]
-            except KeyError as e:
-                raise DependencyNotRegisteredError(e.args[0]) from e
-            return func(deps, *args, **kwargs)
-        return wrapper
+        return inject(func,
+                      self._dependencies,
+                      self._resolve_dependencies,
+                      lambda: self._tracer)
+
+    def _resolve_dependencies(
+            self,
+            leases: List[ManagedDependency]) -> Dict[str, Any]:
+        try:
+            found = self._lookup_dependencies()
+        except KeyError as e:
+            raise DependencyNotRegisteredError(e.args[0]) from e
+        deps: dict[str, Any]
+        if self._group_deps:
+            groups = self._split_to_unique_groups(self._dependencies)
+            deps = {group: {} for group in groups}
+        else:
+            deps = {}
+        for group, dependency_id, dependency in found:
+            value = resolve(dependency, leases)
+            if self._group_deps:
+                deps[group][dependency_id] = value
+            else:
+                deps[group+"."+dependency_id] = value
+        return deps
+
+    def _lookup_dependencies(self) -> List[Tuple[str, str, Any]]:
+        registered_dependencies = self._registry.dependencies
+        found: List[Tuple[str, str, Any]] = []
+        for i in self._dependencies:
+            dependency, group = self._parse_dependency_and_group(i)
+            if dependency == "*":
+                found.extend(
+                    (group, dependency_id, registered)
+                    for dependency_id, registered in (
+                        registered_dependencies[group].items()))
+                continue
+            found.append(
+                (group, dependency, registered_dependencies[group][dependency]))
+        return found
 
 
     @classmethod
@@ -101,13 +119,18 @@ class GroupInjector:
             dependency: Any,
             group_id: Optional[str] = None,
             *,
-            if_group_not_exists: Literal["error", "create"] = "error") -> None:
+            if_group_not_exists: Literal["error", "create"] = "error",
+            finalizer: Optional[Callable[[Any], Any]] = None) -> None:
         """Register a dependency within a specified group.
 
         :param dependency_id: The unique identifier for the dependency.
         :param dependency: The actual dependency (e.g., object, class, function).
+            A :class:`~easy_di.providers.ScopedProvider` is resolved to its
+            value for the current thread or task on every injection.
         :param group_id: The group where the dependency should be registered.
         :param if_group_not_exists: What to do when a dependency group is not registered.
+        :param finalizer: Called with the dependency once it is replaced or
+            unregistered and no running call uses it anymore.
         :raises TypeError: If dependency_id or group_id is not a string.
         :raises ValueError: If the dependency ID is '*'.
         :raises DependencyGroupNotRegisteredError: If the specified group is not registered.
@@ -119,14 +142,59 @@ class GroupInjector:
             group_id)
         if dependency_id == "*":
             raise ValueError("Dependency ID cannot be '*'")
-        if group_id not in cls._registered_dependencies:
+        registry = cls._registry
+        if group_id not in registry.dependencies:
             if if_group_not_exists == "create":
                 cls.register_dependency_group(group_id)
             else:
                 raise DependencyGroupNotRegisteredError(group_id)
-        if dependency_id in cls._registered_dependencies[group_id]:
+        if dependency_id in registry.dependencies[group_id]:
             raise DependencyRegisteredError(dependency_id)
-        cls._registered_dependencies[group_id][dependency_id] = dependency
+        if finalizer is not None:
+            dependency = ManagedDependency(dependency_id, dependency, finalizer)
+            registry.managed[group_id, dependency_id] = dependency
+        cls._writable_group(group_id)[dependency_id] = dependency
+
+    @classmethod
+    def replace_dependency(
+            cls,
+            dependency_id: str,
+            dependency: Any,
+            group_id: Optional[str] = None,
+            *,
+            finalizer: Optional[Callable[[Any], Any]] = None) -> None:
+        """Atomically replace a dependency within a group.
+
+        New calls get the new dependency immediately, while running calls
+        keep the old one. If the old dependency was registered with a
+        finalizer, it is finalized after the last of those calls finishes.
+
+        :param dependency_id: The unique identifier of the dependency.
+        :param dependency: The new dependency.
+        :param group_id: The group of the dependency.
+        :param finalizer: Called with the new dependency once it is replaced
+            or unregistered and no running call uses it anymore.
+        :raises TypeError: If dependency_id or group_id is not a string.
+        :raises DependencyGroupNotRegisteredError: If the specified group is not registered.
+        :raises DependencyNotRegisteredError: If the dependency is not found in the group.
+        :raises DependencyFormatError: If the dependency ID is not contain group and group_id is not specified.
+        """
+        dependency_id, group_id = cls._parse_dependency_and_group(
+            dependency_id,
+            group_id)
+        registry = cls._registry
+        if group_id not in registry.dependencies:
+            raise DependencyGroupNotRegisteredError(group_id)
+        if dependency_id not in registry.dependencies[group_id]:
+            raise DependencyNotRegisteredError(dependency_id)
+        registry.managed.pop((group_id, dependency_id), None)
+        if finalizer is not None:
+            dependency = ManagedDependency(dependency_id, dependency, finalizer)
+            registry.managed[group_id, dependency_id] = dependency
+        group = cls._writable_group(group_id)
+        old = group[dependency_id]
+        group[dependency_id] = dependency
+        retire(old, dependency)
 
     @classmethod
     def unregister_dependency(
@@ -145,15 +213,22 @@ class GroupInjector:
         dependency_id, group_id = cls._parse_dependency_and_group(
             dependency_id,
             group_id)
-        if group_id not in cls._registered_dependencies:
+        registry = cls._registry
+        if group_id not in registry.dependencies:
             raise DependencyGroupNotRegisteredError(group_id)
         if dependency_id == "*":
-            cls._registered_dependencies[group_id].clear()
+            group = cls._writable_group(group_id)
+            dependencies = list(group.values())
+            group.clear()
+            cls._forget_managed(group_id)
+            for dependency in dependencies:
+                retire(dependency)
             warn("Deleted all registered dependencies.")
             return
-        if dependency_id not in cls._registered_dependencies[group_id]:
+        if dependency_id not in registry.dependencies[group_id]:
             raise DependencyNotRegisteredError(dependency_id)
-        cls._registered_dependencies[group_id].pop(dependency_id)
+        registry.managed.pop((group_id, dependency_id), None)
+        retire(cls._writable_group(group_id).pop(dependency_id))
 
     @classmethod
     def register_dependency_group(
@@ -170,13 +245,15 @@ class GroupInjector:
         """
         if not isinstance(group_id, str):
             raise TypeError("Dependency group ID must be a string")
-        if group_id in cls._registered_dependencies:
+        registry = cls._registry
+        if group_id in registry.dependencies:
             raise DependencyGroupRegisteredError(group_id)
         if "." in group_id:
             raise ValueError("Dependency group ID cannot contain dot")
         if group_id == "*":
             raise ValueError("Dependency group ID cannot be '*'")
-        cls._registered_dependencies[group_id] = {}
+        registry.writable()[group_id] = {}
+        registry.owned_groups.add(group_id)
         for dependency in dependencies:
             cls.register_dependency(dependency,
                                     dependencies[dependency],
@@ -189,15 +266,132 @@ class GroupInjector:
         :param group_id: The unique identifier of the group to remove.
         :raises DependencyGroupNotRegisteredError: If the group ID is not registered.
         """
+        registry = cls._registry
         if group_id == "*":
-            cls._registered_dependencies.clear()
+            groups = registry.writable()
+            dependencies = [dependency for group in groups.values()
+                            for dependency in group.values()]
+            groups.clear()
+            registry.owned_groups.clear()
+            registry.managed.clear()
+            for dependency in dependencies:
+                retire(dependency)
             warn("Deleted all registered dependency groups.")
             return
-        if group_id not in cls._registered_dependencies:
+        if group_id not in registry.dependencies:
             raise DependencyGroupNotRegisteredError(group_id)
-        if len(cls._registered_dependencies[group_id]) != 0:
+        if len(registry.dependencies[group_id]) != 0:
             warn("Deleting not empty dependency group")
-        cls._registered_dependencies.pop(group_id)
+        group = registry.writable().pop(group_id)
+        registry.owned_groups.discard(group_id)
+        cls._forget_managed(group_id)
+        for dependency in group.values():
+            retire(dependency)
+
+    @classmethod
+    def load_manifest(cls, manifest: Manifest) -> None:
+        """Register all dependencies described by a manifest.
+
+        Providers are imported before the registry is changed, and the
+        registry is rolled back if any registration fails, so either every
+        dependency is registered or none is. Missing groups are created.
+
+        :param manifest: A validated manifest.
+        :raises TypeError: If manifest is not a Manifest.
+        :raises DependencyRegisteredError: If a dependency is already registered.
+        """
+        if not isinstance(manifest, Manifest):
+            raise TypeError("Manifest must be an instance of Manifest")
+        groups = manifest.load()
+        snapshot = cls.snapshot()
+        try:
+            for group_id, dependencies in groups.items():
+                for dependency_id, dependency in dependencies.items():
+                    cls.register_dependency(dependency_id,
+                                            dependency,
+                                            group_id,
+                                            if_group_not_exists="create")
+        except BaseException:
+            cls.restore(snapshot)
+            raise
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Tracer]) -> None:
+        """Enable or disable tracing of injected calls.
+
+        :param tracer: The tracer to use, or None to disable tracing.
+        :raises TypeError: If tracer is neither a Tracer nor None.
+        """
+        if tracer is not None and not isinstance(tracer, Tracer):
+            raise TypeError("Tracer must be an instance of Tracer or None")
+        cls._tracer = tracer
+
+    @classmethod
+    def snapshot(cls) -> RegistrySnapshot[Dict[str, Dict[str, Any]]]:
+        """Take a snapshot of all dependency groups.
+
+        The snapshot shares storage with the registry; the registry and each
+        group are copied lazily on their next change, so taking a snapshot
+        is O(1) in the number of dependencies registered without a finalizer.
+        Dependencies with a finalizer are not finalized while the snapshot is
+        alive.
+
+        :return: A snapshot that can be passed to :meth:`restore`.
+        """
+        registry = cls._registry
+        registry.share()
+        return RegistrySnapshot(cls, registry.dependencies, registry.managed)
+
+    @classmethod
+    def restore(
+            cls,
+            snapshot: RegistrySnapshot[Dict[str, Dict[str, Any]]]) -> None:
+        """Restore all dependency groups from a snapshot in O(1).
+
+        Dependencies with a finalizer that are in the snapshot become
+        available again; those registered after it are retired.
+
+        :param snapshot: A snapshot previously taken with :meth:`snapshot`.
+        :raises TypeError: If the snapshot was not taken from an injector
+            sharing this injector's registry.
+        """
+        registry = cls._registry
+        if (not isinstance(snapshot, RegistrySnapshot)
+                or not issubclass(snapshot._owner,  # noqa: SLF001
+                                  GroupInjector)
+                or snapshot._owner._registry is not registry):  # noqa: SLF001
+            raise TypeError("Snapshot was not taken from this injector")
+        dependencies = snapshot._registry  # noqa: SLF001
+        restored: Dict[Tuple[str, str], ManagedDependency] = dict(
+            snapshot._managed)  # noqa: SLF001
+        for dependency in restored.values():
+            dependency.revive()
+        retired = registry.managed
+        registry.dependencies = dependencies
+        registry.share()
+        registry.managed = restored
+        for (group_id, dependency_id), dependency in retired.items():
+            if restored.get((group_id, dependency_id)) is not dependency:
+                dependency.retire(
+                    dependencies.get(group_id, {}).get(dependency_id))
+
+    @classmethod
+    def _forget_managed(cls, group_id: str) -> None:
+        registry = cls._registry
+        registry.managed = {
+            key: dependency
+            for key, dependency in registry.managed.items()
+            if key[0] != group_id
+        }
+
+    @classmethod
+    def _writable_group(cls, group_id: str) -> Dict[str, Any]:
+        registry = cls._registry
+        groups = registry.writable()
+        if group_id not in registry.owned_groups:
+            groups[group_id] = dict(groups[group_id])
+            registry.owned_groups.add(group_id)
+        return groups[group_id]
 
     @staticmethod
     def _parse_dependency_and_group(
@@ -0,0 +1,200 @@
+"""Wrapping of functions that receive injected dependencies.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+from typing import (TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable,
+                    Dict, Generator, List, Optional, Tuple, TypeVar, cast)
+
+if sys.version_info >= (3, 10):
+    from typing import Concatenate, ParamSpec
+else:
+    from typing_extensions import ParamSpec, Concatenate
+
+from .exceptions import OverwritingArgumentError
+
+if TYPE_CHECKING:
+    from .providers import ManagedDependency
+    from .tracing import Span, Tracer
+
+P = ParamSpec("P")
+T = TypeVar("T")
+ResolveDependencies = Callable[[List["ManagedDependency"]], Dict[str, Any]]
+GetTracer = Callable[[], Optional["Tracer"]]
+
+
+def inject(
+        func: Callable[Concatenate[Dict[str, Any], P], T],
+        dependencies: Tuple[str, ...],
+        resolve_dependencies: ResolveDependencies,
+        get_tracer: GetTracer,
+) -> Callable[P, T]:
+    """Wrap a function to pass resolved dependencies as its first argument.
+
+    Managed dependencies are leased until the call finishes. For coroutine
+    functions that is when the coroutine completes, and for generator
+    functions when the generator is exhausted or closed. Those functions
+    resolve their dependencies when they start running, so lookup errors are
+    raised on the first await or iteration rather than on the call.
+
+    :param func: The function that requires dependency injection.
+    :param dependencies: Dependency IDs the function requires.
+    :param resolve_dependencies: Builds the injected dictionary and appends
+        leased managed dependencies to the given list.
+    :param get_tracer: Returns the tracer of the injector, if any.
+    :return: The wrapped function.
+    """
+    name = getattr(func, "__qualname__", repr(func))
+    if inspect.isasyncgenfunction(func):
+        return cast("Callable[P, T]", _inject_async_generator(
+            func, name, dependencies, resolve_dependencies, get_tracer))
+    if inspect.iscoroutinefunction(func):
+        return cast("Callable[P, T]", _inject_async(
+            func, name, dependencies, resolve_dependencies, get_tracer))
+    if inspect.isgeneratorfunction(func):
+        return cast("Callable[P, T]", _inject_generator(
+            cast("Callable[..., Generator[Any, Any, Any]]", func),
+            name, dependencies, resolve_dependencies, get_tracer))
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        if "deps" in kwargs:
+            raise OverwritingArgumentError("deps")
+        call = _InjectedCall(name, dependencies, get_tracer)
+        try:
+            deps = call.resolve(resolve_dependencies)
+            return func(deps, *args, **kwargs)
+        except BaseException as e:
+            call.fail(e)
+            raise
+        finally:
+            call.finish()
+    return wrapper
+
+
+class _InjectedCall:
+    """Leases and the span of a single injected call."""
+
+    __slots__ = ("leases", "span", "tracer")
+
+    def __init__(
+            self,
+            name: str,
+            dependencies: Tuple[str, ...],
+            get_tracer: GetTracer) -> None:
+        self.leases: List[ManagedDependency] = []
+        self.tracer = get_tracer()
+        self.span: Optional[Span] = None
+        if self.tracer is not None:
+            self.span = self.tracer.start_span(name, dependencies)
+
+    def resolve(
+            self,
+            resolve_dependencies: ResolveDependencies) -> Dict[str, Any]:
+        deps = resolve_dependencies(self.leases)
+        if self.span is not None:
+            self.span.resolved()
+        return deps
+
+    def fail(self, error: BaseException) -> None:
+        # Closing a generator early is not an error of the call.
+        if self.span is not None and not isinstance(error, GeneratorExit):
+            self.span.record_exception(error)
+
+    def finish(self) -> None:
+        # End the span first so finalizers are not counted as call time.
+        if self.tracer is not None and self.span is not None:
+            self.tracer.end_span(self.span)
+        for lease in self.leases:
+            lease.release()
+
+
+def _inject_async(
+        func: Callable[..., Awaitable[Any]],
+        name: str,
+        dependencies: Tuple[str, ...],
+        resolve_dependencies: ResolveDependencies,
+        get_tracer: GetTracer,
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if "deps" in kwargs:
+            raise OverwritingArgumentError("deps")
+        call = _InjectedCall(name, dependencies, get_tracer)
+        try:
+            deps = call.resolve(resolve_dependencies)
+            return await func(deps, *args, **kwargs)
+        except BaseException as e:
+            call.fail(e)
+            raise
+        finally:
+            call.finish()
+    return wrapper
+
+
+def _inject_generator(
+        func: Callable[..., Generator[Any, Any, Any]],
+        name: str,
+        dependencies: Tuple[str, ...],
+        resolve_dependencies: ResolveDependencies,
+        get_tracer: GetTracer,
+) -> Callable[..., Generator[Any, Any, Any]]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Generator[Any, Any, Any]:
+        if "deps" in kwargs:
+            raise OverwritingArgumentError("deps")
+        call = _InjectedCall(name, dependencies, get_tracer)
+        try:
+            deps = call.resolve(resolve_dependencies)
+            return (yield from func(deps, *args, **kwargs))
+        except BaseException as e:
+            call.fail(e)
+            raise
+        finally:
+            call.finish()
+    return wrapper
+
+
+def _inject_async_generator(
+        func: Callable[..., AsyncGenerator[Any, Any]],
+        name: str,
+        dependencies: Tuple[str, ...],
+        resolve_dependencies: ResolveDependencies,
+        get_tracer: GetTracer,
+) -> Callable[..., AsyncGenerator[Any, Any]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, Any]:
+        if "deps" in kwargs:
+            raise OverwritingArgumentError("deps")
+        call = _InjectedCall(name, dependencies, get_tracer)
+        try:
+            deps = call.resolve(resolve_dependencies)
+            generator = func(deps, *args, **kwargs)
+            try:
+                value = await generator.__anext__()
+                while True:
+                    # Forward sent values and thrown exceptions, like
+                    # "yield from" does for synchronous generators.
+                    try:
+                        sent = yield value
+                    except GeneratorExit:  # noqa: PERF203
+                        await generator.aclose()
+                        raise
+                    except BaseException as e:  # noqa: BLE001
+                        value = await generator.athrow(e)
+                    else:
+                        value = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+        except BaseException as e:
+            call.fail(e)
+            raise
+        finally:
+            call.finish()
+    return wrapper
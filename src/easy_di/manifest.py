@@ -0,0 +1,162 @@
+"""Declarative manifests of dependency groups.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Tuple, Union
+
+if sys.version_info >= (3, 11):
+    import tomllib
+    _HAS_TOML = True
+else:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        _HAS_TOML = False
+    else:
+        _HAS_TOML = True
+
+from .providers import TaskLocalProvider, ThreadLocalProvider
+
+if TYPE_CHECKING:
+    import os
+
+ProviderSpec = Union[str, Mapping[str, str]]
+SCOPES = ("value", "singleton", "thread", "task")
+
+
+class Manifest:
+    """A validated mapping of group ID -> dependency ID -> provider.
+
+    A provider is either an import path in the format "module:attribute" or
+    a table ``{"provider": "module:attribute", "scope": "..."}``, where scope
+    is one of:
+
+    * ``value`` (default) - the imported object is registered as is;
+    * ``singleton`` - the imported factory is called once when loading;
+    * ``thread`` - the factory is wrapped into a ThreadLocalProvider;
+    * ``task`` - the factory is wrapped into a TaskLocalProvider.
+    """
+
+    def __init__(
+            self,
+            groups: Mapping[str, Mapping[str, ProviderSpec]]) -> None:
+        """Validate the manifest without importing any provider.
+
+        :param groups: Mapping of group ID to dependencies and their providers.
+        :raises TypeError: If an ID, provider or scope is not a string.
+        :raises ValueError: If an ID, provider or scope has an invalid value.
+        """
+        if not isinstance(groups, Mapping):
+            raise TypeError("Manifest must be a mapping of groups")
+        self._groups: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        for group_id, dependencies in groups.items():
+            self._validate_group_id(group_id)
+            if not isinstance(dependencies, Mapping):
+                msg = f"Dependencies of group '{group_id}' must be a mapping"
+                raise TypeError(msg)
+            self._groups[group_id] = {}
+            for dependency_id, spec in dependencies.items():
+                if not isinstance(dependency_id, str):
+                    raise TypeError("Dependency ID must be a string")
+                if dependency_id == "*":
+                    raise ValueError("Dependency ID cannot be '*'")
+                self._groups[group_id][dependency_id] = (
+                    self._parse_provider(spec))
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike[str]]) -> Manifest:
+        """Load and validate a manifest from a JSON or TOML file.
+
+        :param path: Path to a file with ".json" or ".toml" extension.
+        :raises ValueError: If the file extension is not supported.
+        :raises ImportError: If TOML is read on Python < 3.11 without tomli.
+        """
+        path = Path(path)
+        extension = path.suffix.lower()
+        if extension == ".json":
+            with path.open(encoding="utf-8") as file:
+                return cls(json.load(file))
+        if extension == ".toml":
+            if not _HAS_TOML:
+                raise ImportError("Install 'tomli' to read TOML manifests")
+            with path.open("rb") as file:
+                return cls(tomllib.load(file))
+        msg = f"Unsupported manifest format '{extension}'"
+        raise ValueError(msg)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Return the manifest in a JSON-serializable form."""
+        return {
+            group_id: {
+                dependency_id: {"provider": provider, "scope": scope}
+                for dependency_id, (provider, scope) in dependencies.items()
+            }
+            for group_id, dependencies in self._groups.items()
+        }
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Import every provider and build the dependencies.
+
+        :return: Mapping of group ID to dependency IDs and their dependencies.
+        :raises ImportError: If a provider module cannot be imported.
+        :raises AttributeError: If a provider attribute does not exist.
+        """
+        return {
+            group_id: {
+                dependency_id: self._build(provider, scope)
+                for dependency_id, (provider, scope) in dependencies.items()
+            }
+            for group_id, dependencies in self._groups.items()
+        }
+
+    @staticmethod
+    def _validate_group_id(group_id: str) -> None:
+        if not isinstance(group_id, str):
+            raise TypeError("Dependency group ID must be a string")
+        if "." in group_id:
+            raise ValueError("Dependency group ID cannot contain dot")
+        if group_id == "*":
+            raise ValueError("Dependency group ID cannot be '*'")
+
+    @staticmethod
+    def _parse_provider(spec: ProviderSpec) -> Tuple[str, str]:
+        scope = "value"
+        if isinstance(spec, Mapping):
+            unknown = set(spec) - {"provider", "scope"}
+            if unknown:
+                msg = f"Unknown provider keys: {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+            scope = spec.get("scope", "value")
+            spec = spec.get("provider")  # type: ignore[assignment]
+        if not isinstance(spec, str) or not isinstance(scope, str):
+            raise TypeError("Provider and scope must be strings")
+        module, _, attribute = spec.partition(":")
+        if not module or not attribute:
+            msg = f"Provider '{spec}' must be in format 'module:attribute'"
+            raise ValueError(msg)
+        if scope not in SCOPES:
+            msg = f"Scope must be one of {', '.join(SCOPES)}, got '{scope}'"
+            raise ValueError(msg)
+        return spec, scope
+
+    @staticmethod
+    def _build(provider: str, scope: str) -> Any:
+        module, attribute = provider.split(":", 1)
+        obj: Any = importlib.import_module(module)
+        for name in attribute.split("."):
+            obj = getattr(obj, name)
+        if scope == "singleton":
+            return obj()
+        if scope == "thread":
+            return ThreadLocalProvider(obj)
+        if scope == "task":
+            return TaskLocalProvider(obj)
+        return obj
@@ -0,0 +1,274 @@
+"""Providers that control how and how long dependencies live.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, List, Optional, TypeVar
+from warnings import warn
+
+from .exceptions import DependencyRetiredError, DependencyScopeError
+
+T = TypeVar("T")
+
+
+class ScopedProvider(ABC, Generic[T]):
+    """Base class for dependencies created by a factory once per scope.
+
+    Instances are registered like any other dependency; injectors call
+    :meth:`get` on every injection to obtain the value for the current scope.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], T],
+            cleanup: Optional[Callable[[T], Any]] = None) -> None:
+        """Initialize the provider.
+
+        :param factory: Callable without arguments that creates the value.
+        :param cleanup: Called with the value when its scope ends.
+        :raises TypeError: If factory or cleanup is not callable.
+        """
+        if not callable(factory):
+            raise TypeError("Factory must be callable")
+        if cleanup is not None and not callable(cleanup):
+            raise TypeError("Cleanup must be callable")
+        self._factory = factory
+        self._cleanup = cleanup
+
+    @abstractmethod
+    def get(self) -> T:
+        """Return the value for the current scope, creating it if needed."""
+
+
+class _ThreadValue(Generic[T]):
+    __slots__ = ("__weakref__", "value")
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+
+
+class ThreadLocalProvider(ScopedProvider[T]):
+    """Provides a separate value for every thread.
+
+    The value is stored in :class:`threading.local`, so access does not
+    require any locking. Cleanup runs when the thread finishes.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], T],
+            cleanup: Optional[Callable[[T], Any]] = None) -> None:
+        """Initialize the provider.
+
+        :param factory: Callable without arguments that creates the value.
+        :param cleanup: Called with the value when its thread finishes.
+        :raises TypeError: If factory or cleanup is not callable.
+        """
+        super().__init__(factory, cleanup)
+        self._local = threading.local()
+
+    def get(self) -> T:
+        """Return the value for the current thread, creating it if needed."""
+        try:
+            holder: _ThreadValue[T] = self._local.holder
+        except AttributeError:
+            holder = _ThreadValue(self._factory())
+            if self._cleanup is not None:
+                # The holder is only referenced by the thread-local storage,
+                # which is released when the thread finishes.
+                weakref.finalize(holder, self._cleanup, holder.value)
+            self._local.holder = holder
+        return holder.value
+
+
+class TaskLocalProvider(ScopedProvider[T]):
+    """Provides a separate value for every asyncio task.
+
+    Values are keyed by the task in weak storage and cleanup runs when the
+    task is done.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], T],
+            cleanup: Optional[Callable[[T], Any]] = None) -> None:
+        """Initialize the provider.
+
+        :param factory: Callable without arguments that creates the value.
+        :param cleanup: Called with the value when its task is done.
+        :raises TypeError: If factory or cleanup is not callable.
+        """
+        super().__init__(factory, cleanup)
+        self._values: weakref.WeakKeyDictionary[asyncio.Task[Any], T] = (
+            weakref.WeakKeyDictionary())
+
+    def get(self) -> T:
+        """Return the value for the current task, creating it if needed.
+
+        :raises DependencyScopeError: If called outside of an asyncio task.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            raise DependencyScopeError("task")
+        try:
+            return self._values[task]
+        except KeyError:
+            pass
+        value = self._factory()
+        self._values[task] = value
+        task.add_done_callback(self._on_task_done)
+        return value
+
+    def _on_task_done(self, task: asyncio.Task[Any]) -> None:
+        value = self._values.pop(task)
+        if self._cleanup is not None:
+            self._cleanup(value)
+
+
+class ManagedDependency:
+    """A registered dependency that is finalized once it is no longer used.
+
+    Injected calls hold a lease on the dependency while they run, and
+    registry snapshots pin it while they are alive. After the dependency is
+    replaced or unregistered, the finalizer is called as soon as the last
+    lease is released and the last snapshot pinning it is gone.
+    """
+
+    __slots__ = ("_finalized", "_lock", "_pins", "_successor", "_users",
+                 "dependency_id", "finalizer", "retired", "value")
+
+    def __init__(
+            self,
+            dependency_id: str,
+            value: Any,
+            finalizer: Callable[[Any], Any]) -> None:
+        """Initialize the managed dependency.
+
+        :param dependency_id: The identifier the dependency is registered with.
+        :param value: The actual dependency.
+        :param finalizer: Called with the value when it is no longer used.
+        :raises TypeError: If finalizer is not callable.
+        """
+        if not callable(finalizer):
+            raise TypeError("Finalizer must be callable")
+        self.dependency_id = dependency_id
+        self.value = value
+        self.finalizer = finalizer
+        self.retired = False
+        self._users = 0
+        self._pins = 0
+        self._finalized = False
+        self._successor: Any = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Any:
+        """Lease the dependency for an injected call.
+
+        :return: This dependency, or the registered dependency that replaced
+            it if it is already retired.
+        :raises DependencyRetiredError: If it is retired and was not replaced.
+        """
+        with self._lock:
+            if not self.retired:
+                self._users += 1
+                return self
+            successor = self._successor
+        if successor is None:
+            raise DependencyRetiredError(self.dependency_id)
+        return successor
+
+    def release(self) -> None:
+        """Return a lease taken with :meth:`acquire`."""
+        with self._lock:
+            self._users -= 1
+            idle = self._become_idle()
+        if idle:
+            self._finalize()
+
+    def pin(self) -> None:
+        """Prevent finalization while a snapshot contains the dependency."""
+        with self._lock:
+            self._pins += 1
+
+    def unpin(self) -> None:
+        """Drop a pin taken with :meth:`pin`."""
+        with self._lock:
+            self._pins -= 1
+            idle = self._become_idle()
+        if idle:
+            self._finalize()
+
+    def revive(self) -> None:
+        """Make a retired dependency available again after a restore."""
+        with self._lock:
+            self.retired = False
+            self._successor = None
+
+    def retire(self, successor: Any = None) -> None:
+        """Stop leasing the dependency and finalize it once it is idle.
+
+        :param successor: The dependency that replaced this one, if any.
+        """
+        with self._lock:
+            if self.retired:
+                return
+            self.retired = True
+            self._successor = successor
+            idle = self._become_idle()
+        if idle:
+            self._finalize()
+
+    def _become_idle(self) -> bool:
+        if (not self.retired or self._users or self._pins
+                or self._finalized):
+            return False
+        self._finalized = True
+        return True
+
+    def _finalize(self) -> None:
+        try:
+            self.finalizer(self.value)
+        except Exception as e:  # noqa: BLE001
+            warn(f"Finalizer of dependency '{self.dependency_id}' "
+                 f"failed: {e!r}")
+
+
+def resolve(dependency: Any, leases: List[ManagedDependency]) -> Any:
+    """Return the value that should be injected for a registered dependency.
+
+    :param dependency: The registered dependency.
+    :param leases: Managed dependencies leased for the call are appended here
+        and must be released when the call finishes.
+    :raises DependencyRetiredError: If the dependency was unregistered while
+        resolving.
+    """
+    while isinstance(dependency, ManagedDependency):
+        acquired = dependency.acquire()
+        if acquired is dependency:
+            leases.append(dependency)
+            dependency = dependency.value
+            break
+        dependency = acquired
+    if isinstance(dependency, ScopedProvider):
+        return dependency.get()
+    return dependency
+
+
+def retire(dependency: Any, successor: Any = None) -> None:
+    """Retire a registered dependency if it is managed.
+
+    :param dependency: The dependency removed from the registry.
+    :param successor: The dependency that replaced it, if any.
+    """
+    if isinstance(dependency, ManagedDependency):
+        dependency.retire(successor)
@@ -0,0 +1,53 @@
+"""Copy-on-write storage of registered dependencies.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Generic, Set, TypeVar, cast
+
+if TYPE_CHECKING:
+    from .providers import ManagedDependency
+
+R = TypeVar("R", bound=Dict[str, Any])
+
+
+class Registry(Generic[R]):
+    """The registered dependencies of an injector and its subclasses.
+
+    Injectors keep a single instance as a class attribute and only ever
+    mutate it, so subclasses share both the dependencies and the
+    copy-on-write state with the class that defines the registry.
+    """
+
+    __slots__ = ("dependencies", "managed", "owned_groups", "shared")
+
+    def __init__(self, dependencies: R) -> None:
+        """Initialize the registry.
+
+        :param dependencies: The initial storage of registered dependencies.
+        """
+        self.dependencies = dependencies
+        #: Whether a snapshot shares the storage, so it must be copied first.
+        self.shared = False
+        #: Groups copied since the last snapshot, used by GroupInjector.
+        self.owned_groups: Set[str] = set()
+        #: Dependencies registered with a finalizer.
+        self.managed: Dict[Any, ManagedDependency] = {}
+
+    def __repr__(self) -> str:
+        return f"<Registry: {len(self.dependencies)} entries>"
+
+    def share(self) -> None:
+        """Mark the storage as shared with a snapshot."""
+        self.shared = True
+        self.owned_groups = set()
+
+    def writable(self) -> R:
+        """Return the storage, copying it first if a snapshot shares it."""
+        if self.shared:
+            self.dependencies = cast("R", dict(self.dependencies))
+            self.shared = False
+        return self.dependencies
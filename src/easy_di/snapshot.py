@@ -0,0 +1,56 @@
+"""Immutable snapshots of injector registries.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+import weakref
+from typing import (TYPE_CHECKING, Any, Dict, Generic, Iterable, Mapping,
+                    TypeVar)
+
+if TYPE_CHECKING:
+    from .providers import ManagedDependency
+
+R = TypeVar("R", bound=Dict[str, Any])
+
+
+class RegistrySnapshot(Generic[R]):
+    """An opaque point-in-time copy of an injector registry.
+
+    Snapshots share their storage with the live registry until the registry
+    is changed, so taking and restoring one does not copy any dependencies.
+    Dependencies registered with a finalizer are not finalized while a
+    snapshot that contains them is alive.
+    """
+
+    __slots__ = ("__weakref__", "_managed", "_owner", "_registry")
+
+    def __init__(
+            self,
+            owner: type,
+            registry: R,
+            managed: Mapping[Any, ManagedDependency]) -> None:
+        """Initialize the snapshot.
+
+        :param owner: The injector class the registry belongs to.
+        :param registry: The registry storage shared with the injector.
+        :param managed: The dependencies with a finalizer in the registry.
+        """
+        self._owner = owner
+        self._registry = registry
+        self._managed: Dict[Any, ManagedDependency] = dict(managed)
+        if self._managed:
+            for dependency in self._managed.values():
+                dependency.pin()
+            weakref.finalize(self, _unpin, tuple(self._managed.values()))
+
+    def __repr__(self) -> str:
+        return f"<RegistrySnapshot of {self._owner.__name__}: \
+{len(self._registry)} entries>"
+
+
+def _unpin(dependencies: Iterable[ManagedDependency]) -> None:
+    for dependency in dependencies:
+        dependency.unpin()
@@ -0,0 +1,274 @@
+"""Sampled tracing of injected function calls.
+
+Copyright (c) 2025 David Lishchyshen
+
+See the README file for information on usage and redistribution.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from warnings import warn
+
+if sys.version_info >= (3, 8):
+    from typing import Protocol
+else:
+    from typing_extensions import Protocol
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    _HAS_OPENTELEMETRY = False
+else:
+    _HAS_OPENTELEMETRY = True
+
+
+class Span:
+    """Timings of a single injected call.
+
+    Dependency resolution and the wrapped function are timed separately.
+    Exporters receive spans with these attributes:
+
+    * ``name`` - qualified name of the injected function;
+    * ``dependencies`` - tuple of the requested dependency IDs;
+    * ``start_time_ns``/``end_time_ns`` - wall-clock time since the epoch;
+    * ``resolution_time_ns`` - time spent resolving dependencies, or None if
+      resolution failed;
+    * ``call_time_ns`` - time spent in the function, or None if it was not
+      called;
+    * ``error`` - name of the exception type the call raised, or None;
+    * ``attributes`` - all of the above as OpenTelemetry span attributes.
+    """
+
+    __slots__ = ("_started", "dependencies", "end_time_ns", "error", "name",
+                 "resolution_time_ns", "start_time_ns")
+
+    def __init__(self, name: str, dependencies: Tuple[str, ...]) -> None:
+        """Start the span.
+
+        :param name: Qualified name of the injected function.
+        :param dependencies: Dependency IDs injected into the function.
+        """
+        self.name = name
+        self.dependencies = dependencies
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.resolution_time_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter_ns()
+
+    @property
+    def call_time_ns(self) -> Optional[int]:
+        """Time spent in the wrapped function, if it was called."""
+        if self.resolution_time_ns is None or self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns
+                - self.resolution_time_ns)
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Span attributes following OpenTelemetry naming conventions."""
+        attributes: Dict[str, Any] = {
+            "code.function": self.name,
+            "easy_di.dependencies": self.dependencies,
+        }
+        if self.resolution_time_ns is not None:
+            attributes["easy_di.resolution_time_ns"] = self.resolution_time_ns
+        call_time_ns = self.call_time_ns
+        if call_time_ns is not None:
+            attributes["easy_di.call_time_ns"] = call_time_ns
+        if self.error is not None:
+            attributes["error.type"] = self.error
+        return attributes
+
+    def resolved(self) -> None:
+        """Mark the end of dependency resolution."""
+        self.resolution_time_ns = time.perf_counter_ns() - self._started
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record that the call raised an exception."""
+        self.error = type(exception).__qualname__
+
+    def end(self) -> None:
+        """Finish the span."""
+        self.end_time_ns = (self.start_time_ns
+                            + time.perf_counter_ns() - self._started)
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name}: resolution={self.resolution_time_ns}ns \
+call={self.call_time_ns}ns>"
+
+
+class SpanExportResult(Enum):
+    """Outcome of an export."""
+
+    SUCCESS = 0
+    FAILURE = 1
+
+
+class SupportsSpanExport(Protocol):
+    """Any object that can receive finished spans from a Tracer.
+
+    OpenTelemetry SDK exporters expect their own span type, so they must be
+    wrapped in :class:`OpenTelemetrySpanExporter` instead.
+    """
+
+    def export(self, spans: Sequence[Span]) -> Any:
+        """Export finished spans."""
+
+
+class SpanExporter(ABC):
+    """Base class for span exporters, mirroring OpenTelemetry's exporters."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> SpanExportResult:
+        """Export finished spans.
+
+        :param spans: The spans to export.
+        :return: Whether the export succeeded.
+        """
+
+    def shutdown(self) -> None:  # noqa: B027
+        """Release the resources held by the exporter."""
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:  # noqa: ARG002
+        """Export all buffered spans.
+
+        :param timeout_millis: Maximum time to wait.
+        :return: Whether the flush succeeded.
+        """
+        return True
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Stores finished spans in memory, mainly for tests."""
+
+    def __init__(self) -> None:
+        """Initialize the exporter with no spans."""
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def export(self, spans: Sequence[Span]) -> SpanExportResult:
+        """Store finished spans.
+
+        :param spans: The spans to store.
+        :return: FAILURE if the exporter is shut down, SUCCESS otherwise.
+        """
+        if self._stopped:
+            return SpanExportResult.FAILURE
+        with self._lock:
+            self._spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+    def get_finished_spans(self) -> Tuple[Span, ...]:
+        """Return all stored spans."""
+        with self._lock:
+            return tuple(self._spans)
+
+    def clear(self) -> None:
+        """Remove all stored spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        """Stop storing spans."""
+        self._stopped = True
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Re-emits spans through an OpenTelemetry tracer provider.
+
+    Every exporter and processor configured on the provider receives the
+    spans as regular OpenTelemetry spans. Requires ``opentelemetry-api``.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        """Initialize the exporter.
+
+        :param tracer_provider: The provider to use, or None for the global
+            one.
+        :raises ImportError: If opentelemetry-api is not installed.
+        """
+        if not _HAS_OPENTELEMETRY:
+            raise ImportError(
+                "Install 'opentelemetry-api' to export OpenTelemetry spans")
+        self._tracer = otel_trace.get_tracer(
+            "easy_di", tracer_provider=tracer_provider)
+
+    def export(self, spans: Sequence[Span]) -> SpanExportResult:
+        """Emit finished spans as OpenTelemetry spans.
+
+        :param spans: The spans to emit.
+        :return: SUCCESS once every span is emitted.
+        """
+        for span in spans:
+            otel_span = self._tracer.start_span(
+                span.name,
+                start_time=span.start_time_ns,
+                attributes=span.attributes)
+            if span.error is not None:
+                otel_span.set_status(otel_trace.Status(
+                    otel_trace.StatusCode.ERROR, span.error))
+            otel_span.end(end_time=span.end_time_ns)
+        return SpanExportResult.SUCCESS
+
+
+class Tracer:
+    """Samples injected calls and passes their spans to an exporter."""
+
+    def __init__(
+            self,
+            exporter: SupportsSpanExport,
+            sample_rate: float = 1.0) -> None:
+        """Initialize the tracer.
+
+        :param exporter: The exporter that receives finished spans. Any object
+            with an ``export`` method that accepts a sequence of spans works.
+        :param sample_rate: Fraction of calls to trace, from 0 to 1.
+        :raises TypeError: If exporter does not have an export method or is
+            an OpenTelemetry SDK exporter.
+        :raises ValueError: If sample_rate is not between 0 and 1.
+        """
+        if not callable(getattr(exporter, "export", None)):
+            raise TypeError("Exporter must have an export method")
+        # The module is always imported if an SDK exporter exists.
+        otel_export = sys.modules.get("opentelemetry.sdk.trace.export")
+        if (otel_export is not None
+                and isinstance(exporter, otel_export.SpanExporter)):
+            raise TypeError("Wrap OpenTelemetry SDK exporters in "
+                            "OpenTelemetrySpanExporter")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def start_span(
+            self,
+            name: str,
+            dependencies: Tuple[str, ...]) -> Optional[Span]:
+        """Start a span if the call is sampled.
+
+        :param name: Qualified name of the injected function.
+        :param dependencies: Dependency IDs injected into the function.
+        :return: The started span, or None if the call is not sampled.
+        """
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:  # noqa: S311
+            return None
+        return Span(name, dependencies)
+
+    def end_span(self, span: Span) -> None:
+        """Finish a span and export it.
+
+        :param span: A span returned by :meth:`start_span`.
+        """
+        span.end()
+        try:
+            self.exporter.export((span,))
+        except Exception as e:  # noqa: BLE001
+            warn(f"Failed to export span of '{span.name}': {e!r}")
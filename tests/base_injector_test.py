@@ -1,3 +1,5 @@
+import asyncio
+import gc
 import random
 import unittest
 
@@ -5,22 +7,23 @@ from src import easy_di
 from src.easy_di.exceptions import (DependencyNotRegisteredError,
                                     DependencyRegisteredError,
                                     OverwritingArgumentError)
+from src.easy_di.registry import Registry
 
 mock_func = lambda deps, x: (x, deps["test"])
 
 class BaseInjectorTest(unittest.TestCase):
     def tearDown(self) -> None:
-        easy_di.BaseInjector._registered_dependencies = {}
+        easy_di.BaseInjector._registry = Registry({})
         super().tearDown()
 
     def test_base_register_unregister(self) -> None:
         easy_di.BaseInjector.register("test", "test")
         self.assertDictEqual(
-            easy_di.BaseInjector._registered_dependencies,
+            easy_di.BaseInjector._registry.dependencies,
             {"test": "test"})
         easy_di.BaseInjector.unregister("test")
         self.assertDictEqual(
-            easy_di.BaseInjector._registered_dependencies,
+            easy_di.BaseInjector._registry.dependencies,
             {}
         )
 
@@ -69,7 +72,204 @@ class BaseInjectorTest(unittest.TestCase):
         easy_di.BaseInjector.register("test2", "test2")
         with self.assertWarns(Warning):
             easy_di.BaseInjector.unregister("*")
-        self.assertDictEqual(easy_di.BaseInjector._registered_dependencies, {})
+        self.assertDictEqual(easy_di.BaseInjector._registry.dependencies, {})
+
+    def test_snapshot_restore(self) -> None:
+        easy_di.BaseInjector.register("test", "test")
+        snapshot = easy_di.BaseInjector.snapshot()
+        easy_di.BaseInjector.unregister("test")
+        easy_di.BaseInjector.register("test2", "test2")
+        easy_di.BaseInjector.restore(snapshot)
+        self.assertDictEqual(
+            easy_di.BaseInjector._registry.dependencies,
+            {"test": "test"})
+        easy_di.BaseInjector.register("test3", "test3")
+        easy_di.BaseInjector.restore(snapshot)
+        self.assertDictEqual(
+            easy_di.BaseInjector._registry.dependencies,
+            {"test": "test"})
+
+    def test_replace(self) -> None:
+        finalized = []
+        func = easy_di.BaseInjector("test")(mock_func)
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+
+        @easy_di.BaseInjector("test")
+        def in_flight(deps: dict) -> str:
+            easy_di.BaseInjector.replace("test", "new")
+            self.assertListEqual(finalized, [])
+            self.assertTupleEqual((1, "new"), func(1))
+            return deps["test"]
+
+        self.assertEqual("old", in_flight())
+        self.assertListEqual(finalized, ["old"])
+
+    def test_replace_while_async_call_is_running(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+
+        @easy_di.BaseInjector("test")
+        async def handler(deps: dict, started: asyncio.Event,
+                          proceed: asyncio.Event) -> str:
+            started.set()
+            await proceed.wait()
+            self.assertListEqual(finalized, [])
+            return deps["test"]
+
+        async def main() -> str:
+            started, proceed = asyncio.Event(), asyncio.Event()
+            task = asyncio.ensure_future(handler(started, proceed))
+            await started.wait()
+            easy_di.BaseInjector.replace("test", "new")
+            self.assertListEqual(finalized, [])
+            proceed.set()
+            return await task
+
+        self.assertEqual("old", asyncio.run(main()))
+        self.assertListEqual(finalized, ["old"])
+
+    def test_async_errors_raised_on_await(self) -> None:
+        @easy_di.BaseInjector("test")
+        async def handler(deps: dict) -> None:
+            pass
+
+        coroutine = handler()
+        with self.assertRaises(DependencyNotRegisteredError):
+            asyncio.run(coroutine)
+        coroutine = handler(deps={})
+        with self.assertRaises(OverwritingArgumentError):
+            asyncio.run(coroutine)
+
+    def test_replace_while_generator_is_running(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+
+        @easy_di.BaseInjector("test")
+        def stream(deps: dict):  # type: ignore[no-untyped-def]
+            yield deps["test"]
+            yield deps["test"]
+
+        generator = stream()
+        self.assertEqual("old", next(generator))
+        easy_di.BaseInjector.replace("test", "new")
+        self.assertListEqual(finalized, [])
+        self.assertEqual("old", next(generator))
+        self.assertListEqual(list(generator), [])
+        self.assertListEqual(finalized, ["old"])
+        self.assertListEqual(list(stream()), ["new", "new"])
+
+    def test_generator_closed_early(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+
+        @easy_di.BaseInjector("test")
+        def stream(deps: dict):  # type: ignore[no-untyped-def]
+            received = yield deps["test"]
+            yield received
+
+        generator = stream()
+        self.assertEqual("old", next(generator))
+        self.assertEqual("sent", generator.send("sent"))
+        easy_di.BaseInjector.unregister("test")
+        self.assertListEqual(finalized, [])
+        generator.close()
+        self.assertListEqual(finalized, ["old"])
+
+    def test_replace_while_async_generator_is_running(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+
+        @easy_di.BaseInjector("test")
+        async def stream(deps: dict):  # type: ignore[no-untyped-def]
+            received = yield deps["test"]
+            yield received
+            yield deps["test"]
+
+        async def main() -> list:
+            generator = stream()
+            values = [await generator.__anext__()]
+            easy_di.BaseInjector.replace("test", "new")
+            values.append(await generator.asend("sent"))
+            self.assertListEqual(finalized, [])
+            values.extend([value async for value in generator])
+            return values
+
+        self.assertListEqual(["old", "sent", "old"], asyncio.run(main()))
+        self.assertListEqual(finalized, ["old"])
+
+    def test_snapshot_replace_restore(self) -> None:
+        finalized = []
+        func = easy_di.BaseInjector("test")(mock_func)
+        easy_di.BaseInjector.register("test", "old",
+                                      finalizer=finalized.append)
+        snapshot = easy_di.BaseInjector.snapshot()
+        easy_di.BaseInjector.replace("test", "new",
+                                     finalizer=finalized.append)
+        self.assertTupleEqual((1, "new"), func(1))
+        self.assertListEqual(finalized, [])
+        easy_di.BaseInjector.restore(snapshot)
+        self.assertListEqual(finalized, ["new"])
+        self.assertTupleEqual((1, "old"), func(1))
+        del snapshot
+        gc.collect()
+        easy_di.BaseInjector.unregister("test")
+        self.assertListEqual(finalized, ["new", "old"])
+
+    def test_snapshot_unregister_restore(self) -> None:
+        finalized = []
+        func = easy_di.BaseInjector("test")(mock_func)
+        easy_di.BaseInjector.register("test", "test",
+                                      finalizer=finalized.append)
+        snapshot = easy_di.BaseInjector.snapshot()
+        easy_di.BaseInjector.unregister("test")
+        easy_di.BaseInjector.restore(snapshot)
+        self.assertTupleEqual((1, "test"), func(1))
+        self.assertListEqual(finalized, [])
+
+    def test_finalized_when_snapshot_is_gone(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "test",
+                                      finalizer=finalized.append)
+        snapshot = easy_di.BaseInjector.snapshot()
+        easy_di.BaseInjector.unregister("test")
+        self.assertListEqual(finalized, [])
+        del snapshot
+        gc.collect()
+        self.assertListEqual(finalized, ["test"])
+
+    def test_unregister_finalizes(self) -> None:
+        finalized = []
+        easy_di.BaseInjector.register("test", "test",
+                                      finalizer=finalized.append)
+        easy_di.BaseInjector.unregister("test")
+        self.assertListEqual(finalized, ["test"])
+
+    def test_replace_when_dependency_not_registered(self) -> None:
+        with self.assertRaises(DependencyNotRegisteredError) as e:
+            easy_di.BaseInjector.replace("test", "test")
+        self.assertEqual(e.exception.dependency_id, "test")
+
+    def test_snapshot_restore_with_subclass(self) -> None:
+        class Injector(easy_di.BaseInjector):
+            pass
+
+        easy_di.BaseInjector.register("test", "test")
+        snapshot = Injector.snapshot()
+        Injector.register("test2", "test2")
+        self.assertDictEqual(
+            easy_di.BaseInjector._registry.dependencies,
+            {"test": "test", "test2": "test2"})
+        easy_di.BaseInjector.restore(snapshot)
+        self.assertDictEqual(Injector._registry.dependencies, {"test": "test"})
+
+    def test_restore_foreign_snapshot(self) -> None:
+        with self.assertRaises(TypeError):
+            easy_di.BaseInjector.restore(easy_di.GroupInjector.snapshot())  # type: ignore
 
 
 if __name__ == "__main__":
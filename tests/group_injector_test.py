@@ -8,33 +8,34 @@ from src.easy_di.exceptions import (DependencyFormatError,
                                     DependencyNotRegisteredError,
                                     DependencyRegisteredError,
                                     OverwritingArgumentError)
+from src.easy_di.registry import Registry
 
 mock_func = lambda deps, x: (x, deps["test.test"])
 
 class GroupInjectorTest(unittest.TestCase):
     def tearDown(self) -> None:
-        easy_di.GroupInjector._registered_dependencies = {}
+        easy_di.GroupInjector._registry = Registry({})
         super().tearDown()
 
     def test_register_unregister_group_without_deps(self) -> None:
         easy_di.GroupInjector.register_dependency_group("test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {}})
         easy_di.GroupInjector.unregister_dependency_group("test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {}
         )
 
     def test_register_unregister_group_with_deps(self) -> None:
         easy_di.GroupInjector.register_dependency_group("test", test=452)
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {"test": 452}})
         easy_di.GroupInjector.unregister_dependency_group("test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {}
         )
 
@@ -42,11 +43,11 @@ class GroupInjectorTest(unittest.TestCase):
         easy_di.GroupInjector.register_dependency_group("test")
         easy_di.GroupInjector.register_dependency("test.test", 452)
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {"test": 452}})
         easy_di.GroupInjector.unregister_dependency("test.test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {}}
         )
 
@@ -57,11 +58,11 @@ class GroupInjectorTest(unittest.TestCase):
             452,
             "test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {"test": 452}})
         easy_di.GroupInjector.unregister_dependency("test", "test")
         self.assertDictEqual(
-            easy_di.GroupInjector._registered_dependencies,
+            easy_di.GroupInjector._registry.dependencies,
             {"test": {}}
         )
 
@@ -188,7 +189,7 @@ class GroupInjectorTest(unittest.TestCase):
         easy_di.GroupInjector.register_dependency("test.test2", "test2")
         with self.assertWarns(Warning):
             easy_di.GroupInjector.unregister_dependency("test.*")
-        self.assertDictEqual(easy_di.GroupInjector._registered_dependencies, {"test": {}})
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies, {"test": {}})
 
     def test_unregister_all_dependency_groups(self) -> None:
         easy_di.GroupInjector.register_dependency_group("test")
@@ -199,11 +200,84 @@ class GroupInjectorTest(unittest.TestCase):
         easy_di.GroupInjector.register_dependency("test2.test2", "test2")
         with self.assertWarns(Warning):
             easy_di.GroupInjector.unregister_dependency_group("*")
-        self.assertDictEqual(easy_di.GroupInjector._registered_dependencies, {})
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies, {})
 
     def test_autocreate_group(self) -> None:
         easy_di.GroupInjector.register_dependency("test.test", "test", if_group_not_exists="create")
-        self.assertDictEqual(easy_di.GroupInjector._registered_dependencies, {"test": {"test": "test"}})
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies, {"test": {"test": "test"}})
+
+    def test_replace_dependency(self) -> None:
+        finalized = []
+        easy_di.GroupInjector.register_dependency(
+            "test.test", "old",
+            if_group_not_exists="create",
+            finalizer=finalized.append)
+        func = easy_di.GroupInjector("test.test")(mock_func)
+
+        @easy_di.GroupInjector("test.*")
+        def in_flight(deps: dict) -> str:
+            easy_di.GroupInjector.replace_dependency("test.test", "new",
+                                                     finalizer=finalized.append)
+            self.assertTupleEqual((1, "new"), func(1))
+            return deps["test.test"]
+
+        self.assertEqual("old", in_flight())
+        self.assertListEqual(finalized, ["old"])
+        easy_di.GroupInjector.unregister_dependency_group("*")
+        self.assertListEqual(finalized, ["old", "new"])
+
+    def test_snapshot_replace_dependency_restore(self) -> None:
+        finalized = []
+        easy_di.GroupInjector.register_dependency(
+            "test.test", "old",
+            if_group_not_exists="create",
+            finalizer=finalized.append)
+        func = easy_di.GroupInjector("test.test")(mock_func)
+        snapshot = easy_di.GroupInjector.snapshot()
+        easy_di.GroupInjector.replace_dependency("test.test", "new",
+                                                 finalizer=finalized.append)
+        easy_di.GroupInjector.restore(snapshot)
+        self.assertListEqual(finalized, ["new"])
+        self.assertTupleEqual((1, "old"), func(1))
+
+    def test_replace_dependency_when_not_registered(self) -> None:
+        easy_di.GroupInjector.register_dependency_group("test")
+        with self.assertRaises(DependencyNotRegisteredError) as e:
+            easy_di.GroupInjector.replace_dependency("test.test", "test")
+        self.assertEqual(e.exception.dependency_id, "test")
+
+    def test_snapshot_restore(self) -> None:
+        easy_di.GroupInjector.register_dependency_group("test", test="test")
+        easy_di.GroupInjector.register_dependency_group("test2", test="test")
+        snapshot = easy_di.GroupInjector.snapshot()
+        easy_di.GroupInjector.register_dependency("test.test2", "test2")
+        easy_di.GroupInjector.unregister_dependency_group("test2")
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies,
+                             {"test": {"test": "test", "test2": "test2"}})
+        easy_di.GroupInjector.restore(snapshot)
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies,
+                             {"test": {"test": "test"},
+                              "test2": {"test": "test"}})
+        easy_di.GroupInjector.unregister_dependency("test.test")
+        easy_di.GroupInjector.restore(snapshot)
+        self.assertDictEqual(easy_di.GroupInjector._registry.dependencies,
+                             {"test": {"test": "test"},
+                              "test2": {"test": "test"}})
+
+
+    def test_snapshot_restore_with_subclass(self) -> None:
+        class Injector(easy_di.GroupInjector):
+            pass
+
+        easy_di.GroupInjector.register_dependency_group("test", a=1)
+        snapshot = easy_di.GroupInjector.snapshot()
+        Injector.register_dependency("test.b", 2)
+        easy_di.GroupInjector.register_dependency("test.c", 3)
+        self.assertDictEqual(Injector._registry.dependencies,
+                             {"test": {"a": 1, "b": 2, "c": 3}})
+        easy_di.GroupInjector.restore(snapshot)
+        self.assertDictEqual(Injector._registry.dependencies,
+                             {"test": {"a": 1}})
 
 
 if __name__ == "__main__":
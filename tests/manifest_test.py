@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from src import easy_di
+from src.easy_di.exceptions import DependencyRegisteredError
+from src.easy_di.registry import Registry
+
+
+class ManifestTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        easy_di.GroupInjector._registry = Registry({})
+        super().tearDown()
+
+    def test_load_manifest(self) -> None:
+        manifest = easy_di.Manifest({
+            "test": {
+                "join": "os.path:join",
+                "dict": {"provider": "collections:OrderedDict",
+                         "scope": "singleton"},
+                "local": {"provider": "builtins:object", "scope": "thread"},
+            },
+        })
+        easy_di.GroupInjector.load_manifest(manifest)
+        func = easy_di.GroupInjector("test.*")(lambda deps: deps)
+        deps = func()
+        self.assertIs(deps["test.join"], os.path.join)
+        self.assertIsInstance(deps["test.dict"], OrderedDict)
+        self.assertIs(deps["test.local"], func()["test.local"])
+
+    def test_load_manifest_is_atomic(self) -> None:
+        easy_di.GroupInjector.register_dependency_group("test2", join="test")
+        manifest = easy_di.Manifest({
+            "test": {"join": "os.path:join"},
+            "test2": {"join": "os.path:join"},
+        })
+        with self.assertRaises(DependencyRegisteredError):
+            easy_di.GroupInjector.load_manifest(manifest)
+        self.assertDictEqual(
+            easy_di.GroupInjector._registry.dependencies,
+            {"test2": {"join": "test"}})
+
+    def test_from_file(self) -> None:
+        data = {"test": {"join": {"provider": "os.path:join",
+                                  "scope": "value"}}}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            self.assertDictEqual(
+                easy_di.Manifest.from_file(path).to_dict(), data)
+            path = os.path.join(directory, "manifest.toml")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write('[test]\njoin = { provider = "os.path:join", '
+                           'scope = "value" }\n')
+            self.assertDictEqual(
+                easy_di.Manifest.from_file(path).to_dict(), data)
+            with self.assertRaises(ValueError):
+                easy_di.Manifest.from_file(
+                    os.path.join(directory, "manifest.yaml"))
+
+    def test_incorrect_manifest(self) -> None:
+        with self.assertRaises(ValueError):
+            easy_di.Manifest({"test.test": {}})
+        with self.assertRaises(ValueError):
+            easy_di.Manifest({"test": {"*": "os.path:join"}})
+        with self.assertRaises(ValueError):
+            easy_di.Manifest({"test": {"test": "os.path.join"}})
+        with self.assertRaises(ValueError):
+            easy_di.Manifest({"test": {"test": {"provider": "os:sep",
+                                                "scope": "process"}}})
+        with self.assertRaises(TypeError):
+            easy_di.Manifest({"test": {"test": 1}})  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
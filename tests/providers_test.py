@@ -0,0 +1,108 @@
+import asyncio
+import gc
+import threading
+import unittest
+
+from src import easy_di
+from src.easy_di.exceptions import (DependencyNotRegisteredError,
+                                    DependencyRetiredError,
+                                    DependencyScopeError)
+from src.easy_di.providers import ManagedDependency
+from src.easy_di.registry import Registry
+
+
+class ThreadLocalProviderTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        easy_di.BaseInjector._registry = Registry({})
+        super().tearDown()
+
+    def test_value_per_thread(self) -> None:
+        provider = easy_di.ThreadLocalProvider(object)
+        easy_di.BaseInjector.register("test", provider)
+        func = easy_di.BaseInjector("test")(lambda deps: deps["test"])
+        main_value = func()
+        self.assertIs(main_value, func())
+        values = []
+        thread = threading.Thread(target=lambda: values.append(func()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(main_value, values[0])
+
+    def test_cleanup_when_thread_finishes(self) -> None:
+        cleaned = []
+        provider = easy_di.ThreadLocalProvider(object, cleaned.append)
+        values = []
+        thread = threading.Thread(target=lambda: values.append(provider.get()))
+        thread.start()
+        thread.join()
+        del thread
+        gc.collect()
+        self.assertEqual(cleaned, values)
+
+    def test_factory_key_error(self) -> None:
+        def factory() -> object:
+            raise KeyError("missing")
+
+        easy_di.BaseInjector.register("test",
+                                      easy_di.ThreadLocalProvider(factory))
+        func = easy_di.BaseInjector("test")(lambda deps: deps)
+        with self.assertRaises(KeyError) as e:
+            func()
+        self.assertNotIsInstance(e.exception, DependencyNotRegisteredError)
+
+    def test_abstract_provider(self) -> None:
+        class Provider(easy_di.ScopedProvider[object]):
+            pass
+
+        with self.assertRaises(TypeError):
+            Provider(object)  # type: ignore[abstract]
+
+    def test_not_callable_factory(self) -> None:
+        with self.assertRaises(TypeError):
+            easy_di.ThreadLocalProvider(1)  # type: ignore
+        with self.assertRaises(TypeError):
+            easy_di.ThreadLocalProvider(object, 1)  # type: ignore
+
+
+class ManagedDependencyTest(unittest.TestCase):
+    def test_acquire_retired_without_successor(self) -> None:
+        dependency = ManagedDependency("test", "test", lambda value: None)
+        dependency.retire()
+        with self.assertRaises(DependencyRetiredError) as e:
+            dependency.acquire()
+        self.assertEqual(e.exception.dependency_id, "test")
+
+
+class TaskLocalProviderTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        easy_di.GroupInjector._registry = Registry({})
+        super().tearDown()
+
+    def test_value_per_task_and_cleanup(self) -> None:
+        cleaned = []
+        provider = easy_di.TaskLocalProvider(object, cleaned.append)
+        easy_di.GroupInjector.register_dependency_group("test", test=provider)
+        func = easy_di.GroupInjector("test.test")(
+            lambda deps: deps["test.test"])
+
+        async def task() -> object:
+            value = func()
+            self.assertIs(value, func())
+            return value
+
+        async def main() -> list:
+            return list(await asyncio.gather(task(), task()))
+
+        values = asyncio.run(main())
+        self.assertIsNot(values[0], values[1])
+        self.assertCountEqual(cleaned, values)
+
+    def test_outside_of_task(self) -> None:
+        provider = easy_di.TaskLocalProvider(object)
+        with self.assertRaises(DependencyScopeError) as e:
+            provider.get()
+        self.assertEqual(e.exception.scope, "task")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+import unittest
+from typing import Any, List, Sequence
+
+from src import easy_di
+from src.easy_di.exceptions import DependencyNotRegisteredError
+from src.easy_di.registry import Registry
+
+
+class TracingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.exporter = easy_di.InMemorySpanExporter()
+        tracer = easy_di.Tracer(self.exporter)
+        easy_di.BaseInjector.set_tracer(tracer)
+        easy_di.GroupInjector.set_tracer(tracer)
+
+    def tearDown(self) -> None:
+        easy_di.BaseInjector.set_tracer(None)
+        easy_di.GroupInjector.set_tracer(None)
+        easy_di.BaseInjector._registry = Registry({})
+        easy_di.GroupInjector._registry = Registry({})
+        super().tearDown()
+
+    def test_base_span(self) -> None:
+        def func(deps: dict) -> str:
+            return deps["test"]
+
+        easy_di.BaseInjector.register("test", "test")
+        self.assertEqual("test", easy_di.BaseInjector("test")(func)())
+        span, = self.exporter.get_finished_spans()
+        self.assertEqual(span.name, func.__qualname__)
+        self.assertTupleEqual(span.dependencies, ("test",))
+        self.assertIsNone(span.error)
+        self.assertGreaterEqual(span.resolution_time_ns, 0)
+        self.assertGreaterEqual(span.call_time_ns, 0)
+        self.assertEqual(span.attributes["code.function"], func.__qualname__)
+
+    def test_group_span_with_error(self) -> None:
+        func = easy_di.GroupInjector("test.test")(lambda deps: deps)
+        with self.assertRaises(DependencyNotRegisteredError):
+            func()
+        span, = self.exporter.get_finished_spans()
+        self.assertTupleEqual(span.dependencies, ("test.test",))
+        self.assertEqual(span.error, "DependencyNotRegisteredError")
+        self.assertIsNone(span.resolution_time_ns)
+        self.assertIsNone(span.call_time_ns)
+
+    def test_sampling(self) -> None:
+        easy_di.BaseInjector.set_tracer(
+            easy_di.Tracer(self.exporter, sample_rate=0))
+        easy_di.BaseInjector.register("test", "test")
+        easy_di.BaseInjector("test")(lambda deps: deps)()
+        self.assertTupleEqual(self.exporter.get_finished_spans(), ())
+
+    def test_async_span(self) -> None:
+        async def func(deps: dict) -> None:
+            await asyncio.sleep(0.05)
+
+        easy_di.BaseInjector.register("test", "test")
+        asyncio.run(easy_di.BaseInjector("test")(func)())
+        span, = self.exporter.get_finished_spans()
+        self.assertGreaterEqual(span.call_time_ns, 50_000_000)
+
+    def test_generator_span(self) -> None:
+        @easy_di.BaseInjector("test")
+        def stream(deps: dict):  # type: ignore[no-untyped-def]
+            yield deps["test"]
+            yield deps["test"]
+
+        easy_di.BaseInjector.register("test", "test")
+        generator = stream()
+        next(generator)
+        self.assertTupleEqual(self.exporter.get_finished_spans(), ())
+        generator.close()
+        span, = self.exporter.get_finished_spans()
+        self.assertIsNone(span.error)
+        self.assertGreaterEqual(span.call_time_ns, 0)
+
+    def test_finalizer_not_in_call_time(self) -> None:
+        easy_di.BaseInjector.register(
+            "test", "old", finalizer=lambda value: time.sleep(0.1))
+
+        @easy_di.BaseInjector("test")
+        def func(deps: dict) -> None:
+            easy_di.BaseInjector.replace("test", "new")
+
+        start = time.perf_counter_ns()
+        func()
+        self.assertGreaterEqual(time.perf_counter_ns() - start, 100_000_000)
+        span, = self.exporter.get_finished_spans()
+        self.assertLess(span.call_time_ns, 100_000_000)
+
+    def test_duck_typed_exporter(self) -> None:
+        class Exporter:
+            def __init__(self) -> None:
+                self.spans: List[Any] = []
+
+            def export(self, spans: Sequence[Any]) -> None:
+                self.spans.extend(spans)
+
+        exporter = Exporter()
+        easy_di.BaseInjector.set_tracer(easy_di.Tracer(exporter))
+        easy_di.BaseInjector.register("test", "test")
+        easy_di.BaseInjector("test")(lambda deps: deps)()
+        self.assertEqual(len(exporter.spans), 1)
+
+    def test_abstract_exporter(self) -> None:
+        class Exporter(easy_di.SpanExporter):
+            pass
+
+        with self.assertRaises(TypeError):
+            Exporter()  # type: ignore[abstract]
+
+    def test_incorrect_tracer(self) -> None:
+        with self.assertRaises(ValueError):
+            easy_di.Tracer(self.exporter, sample_rate=2)
+        with self.assertRaises(TypeError):
+            easy_di.Tracer(object())  # type: ignore
+        with self.assertRaises(TypeError):
+            easy_di.BaseInjector.set_tracer(object())  # type: ignore
+
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter)
+except ImportError:
+    TracerProvider = None
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class OpenTelemetrySpanExporterTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        easy_di.BaseInjector.set_tracer(None)
+        easy_di.BaseInjector._registry = Registry({})
+        super().tearDown()
+
+    def test_export(self) -> None:
+        otel_exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(otel_exporter))
+        easy_di.BaseInjector.set_tracer(easy_di.Tracer(
+            easy_di.OpenTelemetrySpanExporter(provider)))
+
+        def func(deps: dict) -> None:
+            raise ValueError
+
+        easy_di.BaseInjector.register("test", "test")
+        with self.assertRaises(ValueError):
+            easy_di.BaseInjector("test")(func)()
+        span, = otel_exporter.get_finished_spans()
+        self.assertEqual(span.name, func.__qualname__)
+        self.assertEqual(span.attributes["error.type"], "ValueError")
+        self.assertFalse(span.status.is_ok)
+
+    def test_reject_sdk_exporter(self) -> None:
+        with self.assertRaises(TypeError):
+            easy_di.Tracer(InMemorySpanExporter())  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()